@@ -10,14 +10,14 @@ from zerver.lib.streams import render_stream_description
 from zerver.lib.types import ProfileDataElementUpdateDict, ProfileFieldData
 from zerver.lib.users import get_user_ids_who_can_access_user
 from zerver.models import CustomProfileField, CustomProfileFieldValue, Realm, UserProfile
-from zerver.models.custom_profile_fields import custom_profile_fields_for_realm
+from zerver.models.custom_profile_fields import custom_profile_fields_for_realm_values
 from zerver.models.users import active_user_ids
 from zerver.tornado.django_api import send_event
 
 
 def notify_realm_custom_profile_fields(realm: Realm) -> None:
-    fields = custom_profile_fields_for_realm(realm.id)
-    event = dict(type="custom_profile_fields", fields=[f.as_dict() for f in fields])
+    fields = custom_profile_fields_for_realm_values(realm.id)
+    event = dict(type="custom_profile_fields", fields=fields)
     send_event(realm, event, active_user_ids(realm.id))
 
 
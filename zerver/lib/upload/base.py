@@ -24,18 +24,20 @@ MAX_EMOJI_GIF_SIZE = 128
 MAX_EMOJI_GIF_FILE_SIZE_BYTES = 128 * 1024 * 1024  # 128 kb
 
 
-INLINE_MIME_TYPES = [
-    "application/pdf",
-    "image/gif",
-    "image/jpeg",
-    "image/png",
-    "image/webp",
-    "video/mp4",
-    "video/webm",
-    # To avoid cross-site scripting attacks, DO NOT add types such
-    # as application/xhtml+xml, application/x-shockwave-flash,
-    # image/svg+xml, text/html, or text/xml.
-]
+INLINE_MIME_TYPES = frozenset(
+    [
+        "application/pdf",
+        "image/gif",
+        "image/jpeg",
+        "image/png",
+        "image/webp",
+        "video/mp4",
+        "video/webm",
+        # To avoid cross-site scripting attacks, DO NOT add types such
+        # as application/xhtml+xml, application/x-shockwave-flash,
+        # image/svg+xml, text/html, or text/xml.
+    ]
+)
 
 
 def sanitize_name(value: str) -> str:
@@ -1,3 +1,4 @@
+import hashlib
 import logging
 import os
 import secrets
@@ -14,6 +15,7 @@ from mypy_boto3_s3.service_resource import Bucket, Object
 from typing_extensions import override
 
 from zerver.lib.avatar_hash import user_avatar_path
+from zerver.lib.cache import cache_with_key
 from zerver.lib.upload.base import (
     INLINE_MIME_TYPES,
     MEDIUM_AVATAR_SIZE,
@@ -105,6 +107,15 @@ def upload_image_to_s3(
     )
 
 
+def signed_upload_url_cache_key(path: str, force_download: bool = False) -> str:
+    return f"signed_upload_url:{hashlib.sha1(path.encode()).hexdigest()}:{int(force_download)}"
+
+
+# Signing the URL is pure CPU work, and popular uploads are requested
+# repeatedly, so we reuse signed URLs for a while.  The cache timeout
+# must be well below SIGNED_UPLOAD_URL_DURATION, so that a cached URL
+# always remains valid for long enough to be fetched.
+@cache_with_key(signed_upload_url_cache_key, timeout=SIGNED_UPLOAD_URL_DURATION // 2)
 def get_signed_upload_url(path: str, force_download: bool = False) -> str:
     client = get_bucket(settings.S3_AUTH_UPLOADS_BUCKET).meta.client
     params = {
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple, TypedDict
 
 import orjson
 from django.core.exceptions import ValidationError
@@ -29,28 +29,28 @@ from zerver.lib.validator import (
     validate_select_field,
 )
 from zerver.models.realms import Realm
-from zerver.models.users import UserProfile, get_user_profile_by_id_in_realm
+from zerver.models.users import UserProfile
 
 
 def check_valid_user_ids(realm_id: int, val: object, allow_deactivated: bool = False) -> List[int]:
     user_ids = check_list(check_int)("User IDs", val)
-    realm = Realm.objects.get(id=realm_id)
+    users_by_id = {
+        user_id: (is_active, is_bot)
+        for user_id, is_active, is_bot in UserProfile.objects.filter(
+            realm_id=realm_id, id__in=user_ids
+        ).values_list("id", "is_active", "is_bot")
+    }
     for user_id in user_ids:
-        # TODO: Structurally, we should be doing a bulk fetch query to
-        # get the users here, not doing these in a loop.  But because
-        # this is a rarely used feature and likely to never have more
-        # than a handful of users, it's probably mostly OK.
-        try:
-            user_profile = get_user_profile_by_id_in_realm(user_id, realm)
-        except UserProfile.DoesNotExist:
+        if user_id not in users_by_id:
             raise ValidationError(_("Invalid user ID: {user_id}").format(user_id=user_id))
 
-        if not allow_deactivated and not user_profile.is_active:
+        is_active, is_bot = users_by_id[user_id]
+        if not allow_deactivated and not is_active:
             raise ValidationError(
                 _("User with ID {user_id} is deactivated").format(user_id=user_id)
             )
 
-        if user_profile.is_bot:
+        if is_bot:
             raise ValidationError(_("User with ID {user_id} is a bot").format(user_id=user_id))
 
     return user_ids
@@ -87,6 +87,9 @@ class CustomProfileField(models.Model):
     EXTERNAL_ACCOUNT = 7
     PRONOUNS = 8
 
+    # Field types whose values are rendered as Markdown.
+    RENDERABLE_FIELD_TYPES = frozenset({SHORT_TEXT, LONG_TEXT})
+
     # These are the fields whose validators require more than var_name
     # and value argument. i.e. SELECT require field_data, USER require
     # realm as argument.
@@ -157,30 +160,54 @@ class CustomProfileField(models.Model):
     def __str__(self) -> str:
         return f"{self.realm!r} {self.name} {self.field_type} {self.order}"
 
-    def as_dict(self) -> ProfileDataElementBase:
-        data_as_dict: ProfileDataElementBase = {
-            "id": self.id,
-            "name": self.name,
-            "type": self.field_type,
-            "hint": self.hint,
-            "field_data": self.field_data,
-            "order": self.order,
-        }
-        if self.display_in_profile_summary:
-            data_as_dict["display_in_profile_summary"] = True
-
-        return data_as_dict
-
     def is_renderable(self) -> bool:
-        if self.field_type in [CustomProfileField.SHORT_TEXT, CustomProfileField.LONG_TEXT]:
-            return True
-        return False
+        return self.field_type in self.RENDERABLE_FIELD_TYPES
 
 
 def custom_profile_fields_for_realm(realm_id: int) -> QuerySet[CustomProfileField]:
     return CustomProfileField.objects.filter(realm=realm_id).order_by("order")
 
 
+class RawCustomProfileFieldRow(TypedDict):
+    id: int
+    name: str
+    field_type: int
+    hint: str
+    field_data: str
+    order: int
+    display_in_profile_summary: bool
+
+
+def _row_to_profile_dict(row: RawCustomProfileFieldRow) -> ProfileDataElementBase:
+    data_as_dict: ProfileDataElementBase = {
+        "id": row["id"],
+        "name": row["name"],
+        "type": row["field_type"],
+        "hint": row["hint"],
+        "field_data": row["field_data"],
+        "order": row["order"],
+    }
+    if row["display_in_profile_summary"]:
+        data_as_dict["display_in_profile_summary"] = True
+
+    return data_as_dict
+
+
+def custom_profile_fields_for_realm_values(realm_id: int) -> List[ProfileDataElementBase]:
+    """Serialized custom profile fields for the realm, fetched without
+    the overhead of instantiating model objects."""
+    rows = custom_profile_fields_for_realm(realm_id).values(
+        "id",
+        "name",
+        "field_type",
+        "hint",
+        "field_data",
+        "order",
+        "display_in_profile_summary",
+    )
+    return [_row_to_profile_dict(row) for row in rows]
+
+
 class CustomProfileFieldValue(models.Model):
     user_profile = models.ForeignKey(UserProfile, on_delete=CASCADE)
     field = models.ForeignKey(CustomProfileField, on_delete=CASCADE)
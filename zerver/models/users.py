@@ -613,15 +613,14 @@ class UserProfile(AbstractBaseUser, PermissionsMixin, UserBaseSettings):
                 converter = field.FIELD_CONVERTERS[field_type]
                 value = converter(value)
 
-            field_data = field.as_dict()
             data.append(
                 {
-                    "id": field_data["id"],
-                    "name": field_data["name"],
-                    "type": field_data["type"],
-                    "hint": field_data["hint"],
-                    "field_data": field_data["field_data"],
-                    "order": field_data["order"],
+                    "id": field.id,
+                    "name": field.name,
+                    "type": field_type,
+                    "hint": field.hint,
+                    "field_data": field.field_data,
+                    "order": field.order,
                     "value": value,
                     "rendered_value": rendered_value,
                 }
@@ -16,7 +16,10 @@ from zerver.lib.markdown import markdown_convert
 from zerver.lib.test_classes import ZulipTestCase
 from zerver.lib.types import ProfileDataElementUpdateDict, ProfileDataElementValue
 from zerver.models import CustomProfileField, CustomProfileFieldValue, UserProfile
-from zerver.models.custom_profile_fields import custom_profile_fields_for_realm
+from zerver.models.custom_profile_fields import (
+    custom_profile_fields_for_realm,
+    custom_profile_fields_for_realm_values,
+)
 from zerver.models.realms import get_realm
 
 
@@ -901,6 +904,40 @@ class ListCustomProfileFieldTest(CustomProfileFieldTestCase):
             content["custom_fields"], sorted(content["custom_fields"], key=lambda x: -x["id"])
         )
 
+    def test_list_values(self) -> None:
+        phone_number = CustomProfileField.objects.get(realm=self.realm, name="Phone number")
+        phone_number.display_in_profile_summary = True
+        phone_number.save()
+        biography = CustomProfileField.objects.get(realm=self.realm, name="Biography")
+
+        fields = {
+            field["id"]: field for field in custom_profile_fields_for_realm_values(self.realm.id)
+        }
+        self.assert_length(fields, self.original_count)
+        self.assertEqual(
+            fields[phone_number.id],
+            {
+                "id": phone_number.id,
+                "name": "Phone number",
+                "type": CustomProfileField.SHORT_TEXT,
+                "hint": "",
+                "field_data": "",
+                "order": phone_number.order,
+                "display_in_profile_summary": True,
+            },
+        )
+        self.assertEqual(
+            fields[biography.id],
+            {
+                "id": biography.id,
+                "name": "Biography",
+                "type": CustomProfileField.LONG_TEXT,
+                "hint": "What are you known for?",
+                "field_data": "",
+                "order": biography.order,
+            },
+        )
+
     def test_get_custom_profile_fields_from_api(self) -> None:
         iago = self.example_user("iago")
         test_bot = self.create_test_bot("foo-bot", iago)
@@ -3,6 +3,7 @@ import os
 import re
 import time
 from io import StringIO
+from mimetypes import guess_type
 from unittest import mock
 from unittest.mock import patch
 from urllib.parse import quote
@@ -43,6 +44,7 @@ from zerver.lib.users import get_api_key
 from zerver.models import Attachment, Message, Realm, RealmDomain, UserProfile
 from zerver.models.realms import get_realm
 from zerver.models.users import get_system_bot, get_user_by_delivery_email
+from zerver.views.upload import file_content_disposition, guess_type_cached
 
 
 class FileUploadTest(UploadSerializeMixin, ZulipTestCase):
@@ -1804,6 +1806,42 @@ class SanitizeNameTests(ZulipTestCase):
         )
 
 
+class FileContentDispositionTests(ZulipTestCase):
+    def test_file_content_disposition(self) -> None:
+        self.assertEqual(
+            file_content_disposition(False, "zulip.txt"), 'inline; filename="zulip.txt"'
+        )
+        self.assertEqual(
+            file_content_disposition(True, "zulip.txt"), 'attachment; filename="zulip.txt"'
+        )
+        self.assertEqual(
+            file_content_disposition(True, 'a\\b"c.txt'), r'attachment; filename="a\\b\"c.txt"'
+        )
+        self.assertEqual(
+            file_content_disposition(False, "áéБД.txt"),
+            "inline; filename*=utf-8''%C3%A1%C3%A9%D0%91%D0%94.txt",
+        )
+
+
+class GuessTypeTests(ZulipTestCase):
+    def test_guess_type_cached(self) -> None:
+        for path in [
+            "2/ab/zulip",
+            "2/ab/zulip.txt",
+            "2/ab/zulip.PNG",
+            "2/ab/tarball.tar.gz",
+            "2/ab/.hidden",
+            "2/ab/.png",
+            "2/ab/..png",
+            "2/ab/many.dots.in.name.pdf",
+            "2/ab/Screenshot-2024-01-05-at-10.30.12.png",
+            "2/ab/tgz.:.pdf",
+            "2/ab/archive.TGZ",
+            "2/ab/archive.tar.Z",
+        ]:
+            self.assertEqual(guess_type_cached(path), guess_type(path))
+
+
 class UploadSpaceTests(UploadSerializeMixin, ZulipTestCase):
     @override
     def setUp(self) -> None:
@@ -35,7 +35,7 @@ from zerver.lib.upload.base import (
     MEDIUM_AVATAR_SIZE,
     resize_avatar,
 )
-from zerver.lib.upload.s3 import S3UploadBackend
+from zerver.lib.upload.s3 import S3UploadBackend, get_signed_upload_url
 from zerver.models import Attachment, RealmEmoji, UserProfile
 from zerver.models.realms import get_realm
 from zerver.models.users import get_system_bot
@@ -248,6 +248,20 @@ class S3Test(ZulipTestCase):
         body = f"First message ...[zulip.txt](http://{hamlet.realm.host}" + url + ")"
         self.send_stream_message(hamlet, "Denmark", body, "test")
 
+    @use_s3_backend
+    def test_signed_upload_url_cached(self) -> None:
+        create_s3_buckets(settings.S3_AUTH_UPLOADS_BUCKET)
+        path_id = "2/ab/zulip.txt"
+
+        url = get_signed_upload_url(path_id)
+        with patch("zerver.lib.upload.s3.get_bucket") as mock_get_bucket:
+            self.assertEqual(get_signed_upload_url(path_id), url)
+        mock_get_bucket.assert_not_called()
+
+        download_url = get_signed_upload_url(path_id, force_download=True)
+        self.assertNotEqual(download_url, url)
+        self.assertIn("response-content-disposition=attachment", download_url)
+
     @use_s3_backend
     def test_user_avatars_redirect(self) -> None:
         create_s3_buckets(settings.S3_AVATAR_BUCKET)[0]
@@ -1149,6 +1149,11 @@ class UserProfileTest(ZulipTestCase):
         # Successfully get non-bot, active user belong to your realm
         check_valid_user_ids(realm.id, [othello.id])
 
+        # Users are validated with a single query, however many there are
+        iago = self.example_user("iago")
+        with self.assert_database_query_count(1):
+            check_valid_user_ids(realm.id, [othello.id, iago.id])
+
     def test_cache_invalidation(self) -> None:
         hamlet = self.example_user("hamlet")
         with mock.patch("zerver.lib.cache.delete_display_recipient_cache") as m:
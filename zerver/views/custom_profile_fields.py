@@ -34,14 +34,14 @@ from zerver.lib.validator import (
     validate_select_field_data,
 )
 from zerver.models import CustomProfileField, Realm, UserProfile
-from zerver.models.custom_profile_fields import custom_profile_fields_for_realm
+from zerver.models.custom_profile_fields import custom_profile_fields_for_realm_values
 
 
 def list_realm_custom_profile_fields(
     request: HttpRequest, user_profile: UserProfile
 ) -> HttpResponse:
-    fields = custom_profile_fields_for_realm(user_profile.realm_id)
-    return json_success(request, data={"custom_fields": [f.as_dict() for f in fields]})
+    fields = custom_profile_fields_for_realm_values(user_profile.realm_id)
+    return json_success(request, data={"custom_fields": fields})
 
 
 hint_validator = check_capped_string(CustomProfileField.HINT_MAX_LENGTH)
@@ -1,9 +1,10 @@
 import base64
 import binascii
+import mimetypes
 import os
 from datetime import timedelta
-from mimetypes import guess_type
-from typing import List, Optional, Union
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 from urllib.parse import quote, urlsplit
 
 from django.conf import settings
@@ -21,7 +22,6 @@ from django.http import (
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.utils.cache import patch_cache_control, patch_vary_headers
-from django.utils.http import content_disposition_header
 from django.utils.translation import gettext as _
 
 from zerver.context_processors import get_valid_realm_from_request
@@ -41,12 +41,44 @@ from zerver.lib.upload.s3 import get_signed_upload_url
 from zerver.models import UserProfile
 
 
-def patch_disposition_header(response: HttpResponse, url: str, is_attachment: bool) -> None:
-    filename = os.path.basename(urlsplit(url).path)
-    content_disposition = content_disposition_header(is_attachment, filename)
+@lru_cache(maxsize=1024)
+def _guess_type_by_suffix(suffix: str) -> Tuple[Optional[str], Optional[str]]:
+    # The "x/" prefix keeps guess_type from parsing anything before a
+    # ":" in the suffix as a URL scheme.
+    return mimetypes.guess_type("x/x" + suffix)
+
+
+def guess_type_cached(path: str) -> Tuple[Optional[str], Optional[str]]:
+    # guess_type only looks at the last extension of the filename, and
+    # the one before it if the last is an encoding (e.g. ".tar.gz") or
+    # a suffix alias (e.g. ".tgz"), so we cache on just those.
+    base, suffix = os.path.splitext(path)
+    if any(
+        ext in mimetypes.encodings_map or ext in mimetypes.suffix_map
+        for ext in (suffix, suffix.lower())
+    ):
+        suffix = os.path.splitext(base)[1] + suffix
+    return _guess_type_by_suffix(suffix)
+
+
+def file_content_disposition(is_attachment: bool, filename: str) -> str:
+    # Like django.utils.http.content_disposition_header for a
+    # non-empty filename, but detects non-ASCII filenames with
+    # str.isascii rather than by encoding the filename and catching
+    # UnicodeEncodeError.
+    disposition = "attachment" if is_attachment else "inline"
+    if filename.isascii():
+        escaped_filename = filename.replace("\\", "\\\\").replace('"', r"\"")
+        file_expr = f'filename="{escaped_filename}"'
+    else:
+        file_expr = f"filename*=utf-8''{quote(filename)}"
+    return f"{disposition}; {file_expr}"
+
 
-    if content_disposition is not None:
-        response.headers["Content-Disposition"] = content_disposition
+def patch_disposition_header(response: HttpResponse, path: str, is_attachment: bool) -> None:
+    # path is that of a file on disk, so the filename is never empty.
+    filename = os.path.basename(path)
+    response.headers["Content-Disposition"] = file_content_disposition(is_attachment, filename)
 
 
 def internal_nginx_redirect(internal_path: str, content_type: Optional[str] = None) -> HttpResponse:
@@ -65,8 +97,7 @@ def internal_nginx_redirect(internal_path: str, content_type: Optional[str] = No
     # desire, and the client will see those values.  In some cases
     # (local files) we do wish to control the Content-Type, so also
     # support setting it explicitly.
-    response = HttpResponse(content_type=content_type)
-    response["X-Accel-Redirect"] = internal_path
+    response = HttpResponse(content_type=content_type, headers={"X-Accel-Redirect": internal_path})
     if content_type is None:
         del response["Content-Type"]
     return response
@@ -103,23 +134,30 @@ def serve_s3(request: HttpRequest, path_id: str, force_download: bool = False) -
     return response
 
 
+class LargeBlockFileResponse(FileResponse):
+    # FileResponse reads the file in 4KiB blocks by default, which
+    # means many read() calls for large attachments.
+    block_size = 64 * 1024
+
+
 def serve_local(
     request: HttpRequest, path_id: str, force_download: bool = False
 ) -> HttpResponseBase:
-    assert settings.LOCAL_FILES_DIR is not None
-    local_path = os.path.join(settings.LOCAL_FILES_DIR, path_id)
+    local_files_dir = settings.LOCAL_FILES_DIR
+    assert local_files_dir is not None
+    local_path = os.path.join(local_files_dir, path_id)
     assert_is_local_storage_path("files", local_path)
     if not os.path.isfile(local_path):
         return HttpResponseNotFound("<p>File not found</p>")
 
-    mimetype, encoding = guess_type(path_id)
+    mimetype, encoding = guess_type_cached(path_id)
     download = force_download or mimetype not in INLINE_MIME_TYPES
 
     if settings.DEVELOPMENT:
         # In development, we do not have the nginx server to offload
         # the response to; serve it directly ourselves.  FileResponse
         # handles setting Content-Type, Content-Disposition, etc.
-        response: HttpResponseBase = FileResponse(
+        response: HttpResponseBase = LargeBlockFileResponse(
             open(local_path, "rb"), as_attachment=download  # noqa: SIM115
         )
         patch_cache_control(response, private=True, immutable=True)
@@ -240,7 +278,7 @@ def generate_unauthed_file_access_url(path_id: str) -> str:
     signed_data = TimestampSigner(salt=USER_UPLOADS_ACCESS_TOKEN_SALT).sign(path_id)
     token = base64.b16encode(signed_data.encode()).decode()
 
-    filename = path_id.split("/")[-1]
+    filename = path_id.rpartition("/")[2]
     return reverse("file_unauthed_from_token", args=[token, filename])
 
 
@@ -263,7 +301,7 @@ def serve_file_unauthed_from_token(
     path_id = get_file_path_id_from_token(token)
     if path_id is None:
         raise JsonableError(_("Invalid token"))
-    if path_id.split("/")[-1] != filename:
+    if path_id.rpartition("/")[2] != filename:
         raise JsonableError(_("Invalid filename"))
 
     if settings.LOCAL_UPLOADS_DIR is not None:
@@ -306,21 +344,25 @@ def serve_local_avatar_unauthed(request: HttpRequest, path: str) -> HttpResponse
 
 
 def upload_file_backend(request: HttpRequest, user_profile: UserProfile) -> HttpResponse:
-    if len(request.FILES) == 0:
+    num_files = len(request.FILES)
+    if num_files == 0:
         raise JsonableError(_("You must specify a file to upload"))
-    if len(request.FILES) != 1:
+    if num_files != 1:
         raise JsonableError(_("You may only upload one file at a time"))
 
     [user_file] = request.FILES.values()
     assert isinstance(user_file, UploadedFile)
     file_size = user_file.size
     assert file_size is not None
-    if file_size > settings.MAX_FILE_UPLOAD_SIZE * 1024 * 1024:
+    max_file_upload_size_mib = settings.MAX_FILE_UPLOAD_SIZE
+    if file_size > max_file_upload_size_mib * 1024 * 1024:
         raise JsonableError(
             _("Uploaded file is larger than the allowed limit of {max_size} MiB").format(
-                max_size=settings.MAX_FILE_UPLOAD_SIZE,
+                max_size=max_file_upload_size_mib,
             )
         )
+    # Both limits are checked before the file's contents are passed
+    # to the storage backend.
     check_upload_within_quota(user_profile.realm, file_size)
 
     uri = upload_message_attachment_from_request(user_file, user_profile, file_size)